@@ -1,6 +1,6 @@
 """CSV comparison module for comparing two parsed CSV files."""
 
-from typing import Callable, Dict, List
+from typing import Callable, Dict, List, Optional, Tuple
 
 from .csv_compare_output import CSVCompareOutput
 from .csv_parser import CSVParser, NullCSVParser
@@ -19,6 +19,25 @@ class CSVComparer:
     def __init__(self) -> None:
         self.first_file: CSVParser = NullCSVParser()
         self.second_file: CSVParser = NullCSVParser()
+        self._compare_cache: Optional[Tuple[tuple, CSVCompareOutput]] = None
+
+    def _compare_cache_key(self, index_column: str) -> tuple:
+        """Build the memoization key for a compare call.
+
+        The key holds the parser objects themselves, not their ids:
+        CSVParser compares by identity, so the tuple comparison checks
+        the same parsers are still attached, and keeping the references
+        alive rules out a recycled id matching a replaced parser. The
+        version counters then capture every mutation, so matching keys
+        guarantee an identical comparison result.
+        """
+        return (
+            self.first_file,
+            self.first_file._version,
+            self.second_file,
+            self.second_file._version,
+            index_column,
+        )
 
     @classmethod
     def from_files(cls, first_file: str, second_file: str) -> "CSVComparer":
@@ -138,6 +157,12 @@ class CSVComparer:
         Raises:
             ValueError: If index_column does not exist in either CSV file.
         """
+        # Reuse the previous result if neither parser changed since then
+        if self._compare_cache is not None:
+            cache_key, cached_output = self._compare_cache
+            if cache_key == self._compare_cache_key(index_column):
+                return cached_output
+
         # Validate that index_column exists in both files
         if index_column not in self.first_file.column_names:
             raise ValueError(
@@ -155,40 +180,91 @@ class CSVComparer:
         # Convert to sets for efficient lookups (O(1) instead of O(n))
         first_cols = set(self.first_file.column_names)
         second_cols = set(self.second_file.column_names)
-        first_rows = set(self.first_file.row_values_in_column(index_column))
-        second_rows = set(self.second_file.row_values_in_column(index_column))
+        first_row_vals = self.first_file.row_values_in_column(index_column)
+        second_row_vals = self.second_file.row_values_in_column(index_column)
+        first_rows = set(first_row_vals)
+        second_rows = set(second_row_vals)
+
+        # Set-filtered comprehensions keep membership checks O(1) while
+        # preserving the source order, so results are deterministic
+        # instead of following set iteration order
 
         # Find columns that exist in first file but not in second
-        extra_cols_in_first_file = list(first_cols - second_cols)
+        extra_cols_in_first_file = [
+            col for col in self.first_file.column_names if col not in second_cols
+        ]
 
         # Find columns that exist in second file but not in first
-        extra_cols_in_second_file = list(second_cols - first_cols)
+        extra_cols_in_second_file = [
+            col for col in self.second_file.column_names if col not in first_cols
+        ]
 
         # Find rows that exist in first file but not in second
-        extra_rows_in_first_file = list(first_rows - second_rows)
+        extra_rows_in_first_file = [
+            row for row in first_row_vals if row not in second_rows
+        ]
 
         # Find rows that exist in second file but not in first
-        extra_rows_in_second_file = list(second_rows - first_rows)
+        extra_rows_in_second_file = [
+            row for row in second_row_vals if row not in first_rows
+        ]
 
         # Find columns and rows that exist in both files
-        common_columns = list(first_cols & second_cols)
-        common_rows = list(first_rows & second_rows)
+        common_columns = tuple(
+            col for col in self.first_file.column_names if col in second_cols
+        )
+        common_rows = [row for row in first_row_vals if row in second_rows]
+
+        # No shared columns or no shared rows means no cells to compare,
+        # so the hash join and the mismatch scan can be skipped outright.
+        # (The exact row-key intersection is already in hand, so no
+        # cheaper range prefilter is needed.)
+        mismatched_rows: List[Dict[str, str]] = []
+        if common_columns and common_rows:
+            # Build index-value -> row-dict lookup tables once per file
+            # so the comparison below is a hash join instead of a linear
+            # scan per cell
+            first_index = {
+                row[index_column]: row for row in self.first_file.list_of_dicts
+            }
+            second_index = {
+                row[index_column]: row for row in self.second_file.list_of_dicts
+            }
+
+            # Compare values in common rows and columns to find mismatches.
+            # Rows whose dicts compare equal (a single C-level comparison)
+            # cannot contribute mismatches and are pruned up front.
+            differing = [
+                (row, first_index[row], second_index[row])
+                for row in common_rows
+                if first_index[row] != second_index[row]
+            ]
 
-        # Compare values in common rows and columns to find mismatches
-        mismatched_rows = []
-        for row in common_rows:
+            # Scan column-by-column: aligned value lists for a fully
+            # matching column compare equal in one C-level list
+            # comparison, so the per-cell loop only runs for columns
+            # that actually differ
             for column in common_columns:
-                first_val = self.first_file.get_value(row, column)
-                second_val = self.second_file.get_value(row, column)
-                if first_val != second_val:
-                    mismatched_rows.append(
-                        {
-                            "row": row,
-                            "column": column,
-                            "first": first_val,
-                            "second": second_val,
-                        }
-                    )
+                first_vals = [
+                    first_row.get(column, "") for _, first_row, _ in differing
+                ]
+                second_vals = [
+                    second_row.get(column, "") for _, _, second_row in differing
+                ]
+                if first_vals == second_vals:
+                    continue
+                for (row, _, _), first_val, second_val in zip(
+                    differing, first_vals, second_vals
+                ):
+                    if first_val != second_val:
+                        mismatched_rows.append(
+                            {
+                                "row": row,
+                                "column": column,
+                                "first": first_val,
+                                "second": second_val,
+                            }
+                        )
 
         # Determine if files match: true only if there are no differences
         match_result = not any(
@@ -201,7 +277,7 @@ class CSVComparer:
             ]
         )
 
-        return CSVCompareOutput(
+        output = CSVCompareOutput(
             match_result=match_result,
             first_file=self.first_file.file_path,
             second_file=self.second_file.file_path,
@@ -211,3 +287,7 @@ class CSVComparer:
             extra_rows_in_second_file=extra_rows_in_second_file,
             mismatched_rows=mismatched_rows,
         )
+        # Key on the post-compare versions: setting the index columns above
+        # bumps them, and an unchanged repeat call sees these same values
+        self._compare_cache = (self._compare_cache_key(index_column), output)
+        return output
@@ -1,7 +1,7 @@
 """Output model for CSV comparison results."""
 
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 
 @dataclass
@@ -19,6 +19,19 @@ class CSVCompareOutput:
         mismatched_rows: List of dicts describing cell-level mismatches.
     """
 
+    __slots__ = (
+        "match_result",
+        "first_file",
+        "second_file",
+        "extra_cols_in_first_file",
+        "extra_cols_in_second_file",
+        "extra_rows_in_first_file",
+        "extra_rows_in_second_file",
+        "mismatched_rows",
+        "_dict_cache",
+        "_str_cache",
+    )
+
     match_result: bool
     first_file: str
     second_file: str
@@ -28,13 +41,24 @@ class CSVCompareOutput:
     extra_rows_in_second_file: List[str]
     mismatched_rows: List[Dict[str, str]]
 
+    def __post_init__(self) -> None:
+        # cached_property needs __dict__, so with __slots__ the memoized
+        # to_dict / __str__ results live in dedicated slots instead
+        self._dict_cache: Optional[Dict] = None
+        self._str_cache: Optional[str] = None
+
     def to_dict(self) -> Dict:
         """Convert the comparison result to a dictionary.
 
+        The dictionary is built once and reused on later calls; callers
+        should treat it as read-only.
+
         Returns:
             Dict: Dictionary representation of the comparison result.
         """
-        return {
+        if self._dict_cache is not None:
+            return self._dict_cache
+        self._dict_cache = {
             "first_file": self.first_file,
             "second_file": self.second_file,
             "match_result": self.match_result,
@@ -44,6 +68,7 @@ class CSVCompareOutput:
             "extra_rows_in_second_file": self.extra_rows_in_second_file,
             "mismatched_rows": self.mismatched_rows,
         }
+        return self._dict_cache
 
     def __str__(self) -> str:
         """Format the comparison result as a human-readable string.
@@ -51,30 +76,38 @@ class CSVCompareOutput:
         Returns:
             str: Multi-line summary of the comparison.
         """
-        lines = []
-        lines.append(f"First file: {self.first_file}")
-        lines.append(f"Second file: {self.second_file}")
-        lines.append(f"Match result: {self.match_result}")
+        if self._str_cache is not None:
+            return self._str_cache
+        lines = [
+            f"First file: {self.first_file}",
+            f"Second file: {self.second_file}",
+            f"Match result: {self.match_result}",
+        ]
 
         if self.extra_cols_in_first_file:
             lines.append("Extra columns in first file")
-            lines.extend([f"\t{x}" for x in self.extra_cols_in_first_file])
+            lines.extend(f"\t{x}" for x in self.extra_cols_in_first_file)
 
         if self.extra_cols_in_second_file:
             lines.append("Extra columns in second file")
-            lines.extend([f"\t{x}" for x in self.extra_cols_in_second_file])
+            lines.extend(f"\t{x}" for x in self.extra_cols_in_second_file)
         if self.extra_rows_in_first_file:
             lines.append("Extra rows in first file")
-            lines.extend([f"\t{x}" for x in self.extra_rows_in_first_file])
+            lines.extend(f"\t{x}" for x in self.extra_rows_in_first_file)
         if self.extra_rows_in_second_file:
             lines.append("Extra rows in second file")
-            lines.extend([f"\t{x}" for x in self.extra_rows_in_second_file])
+            lines.extend(f"\t{x}" for x in self.extra_rows_in_second_file)
         if self.mismatched_rows:
             lines.append("Mismatched rows")
+            fmt = "\trow: {}, column: {}, first: {}, second: {}".format
             lines.extend(
-                [
-                    f"\trow: {x.get('row', '')}, column: {x.get('column', '')}, first: {x.get('first', '')}, second: {x.get('second', '')}"
-                    for x in self.mismatched_rows
-                ]
+                fmt(
+                    x.get("row", ""),
+                    x.get("column", ""),
+                    x.get("first", ""),
+                    x.get("second", ""),
+                )
+                for x in self.mismatched_rows
             )
-        return "\n".join(lines)
+        self._str_cache = "\n".join(lines)
+        return self._str_cache
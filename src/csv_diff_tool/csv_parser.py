@@ -1,13 +1,30 @@
 """CSV parsing module for reading, transforming, and writing CSV data."""
 
+import codecs
 import csv
 import io
 import logging
 import os
-from collections import defaultdict
-from typing import Callable, Dict, List, Optional
+import sys
+from functools import lru_cache
+from itertools import filterfalse
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
-import chardet
+# Prefer the faster C/vectorized detectors when installed, falling back
+# to the pure-Python chardet that is always available as a dependency.
+try:
+    from cchardet import UniversalDetector
+
+    _detect = None
+except ImportError:
+    try:
+        from charset_normalizer import detect as _detect
+
+        UniversalDetector = None
+    except ImportError:
+        from chardet import UniversalDetector
+
+        _detect = None
 
 
 class CSVParser:
@@ -17,18 +34,100 @@ class CSVParser:
     and writing modified data back to files.
     """
 
+    __slots__ = (
+        "list_of_dicts",
+        "_column_names",
+        "_column_set",
+        "_file_text",
+        "_index_column",
+        "file_path",
+        "_encoding",
+        "_header_in_file",
+        "_row_by_index",
+        "_groups",
+        "_columns_cache",
+        "_has_error_cache",
+        "_version",
+    )
+
     def __init__(self) -> None:
         self.list_of_dicts: List[Dict[str, str]] = []
         self.column_names: List[str] = []
-        self.file_text: str = ""
+        self._file_text: Optional[str] = None
         self._index_column: str = ""
         self.file_path: str = ""
         self._encoding: str = "utf-8"
+        self._header_in_file: bool = True
+        self._row_by_index: Dict[str, Dict[str, str]] = {}
+        self._groups: Dict[str, Dict[str, List[Dict[str, str]]]] = {}
+        self._columns_cache: Optional[Dict[str, List[str]]] = None
+        self._has_error_cache: Optional[bool] = None
+        self._version: int = 0
+
+    #: Chunk size used when feeding bytes to the encoding detector.
+    _DETECT_CHUNK_SIZE = 64 * 1024
+    #: Upper bound on bytes examined during encoding detection (1 MiB).
+    _DETECT_MAX_BYTES = 1024 * 1024
+    #: Buffer size used when reading CSV files (128 KiB).
+    _READ_BUFFER_SIZE = 128 * 1024
 
-    @staticmethod
-    def get_encoding(file_path: str) -> Optional[str]:
+    @property
+    def column_names(self) -> List[str]:
+        """List of column names, in CSV order.
+
+        Returns:
+            List[str]: The column names.
+        """
+        return self._column_names
+
+    @column_names.setter
+    def column_names(self, value: List[str]) -> None:
+        """Set the column names and refresh the membership set.
+
+        A set mirror of the names is kept in sync so hot methods can test
+        column membership in O(1) instead of scanning the list.
+
+        Args:
+            value (List[str]): The new column names.
+        """
+        self._column_names = value
+        self._column_set = set(value)
+
+    @property
+    def file_text(self) -> str:
+        """CSV content as text.
+
+        For file-backed parsers the text is read lazily on first access
+        (it is only needed for raw-text checks like has_error); parsing
+        itself streams straight from the file.
+
+        Returns:
+            str: The raw CSV text.
+        """
+        if self._file_text is None:
+            if os.path.isfile(self.file_path):
+                with open(self.file_path, encoding=self._encoding) as f:
+                    self._file_text = f.read()
+            else:
+                self._file_text = ""
+        return self._file_text
+
+    @file_text.setter
+    def file_text(self, value: str) -> None:
+        self._file_text = value
+        # has_error is derived from file_text, so its cache must not
+        # outlive a reassignment
+        self._has_error_cache = None
+
+    @classmethod
+    def get_encoding(cls, file_path: str) -> Optional[str]:
         """Detect the encoding of the file.
 
+        Feeds the file to the detector in fixed-size chunks and stops as
+        soon as the detector is confident (or after 1 MiB), so only the
+        bytes needed for detection are read instead of the whole file.
+        Pure-ASCII heads skip statistical detection entirely.
+
         Args:
             file_path (str): File path of the text file.
 
@@ -36,8 +135,36 @@ class CSVParser:
             Optional[str]: Detected encoding, or None if detection fails.
         """
         with open(file_path, "rb") as f:
-            rawdata = b"".join(f.readlines())
-        return chardet.detect(rawdata)["encoding"]
+            head = f.read(4096)
+            if head.startswith(codecs.BOM_UTF8):
+                return "utf-8-sig"
+            # UTF-32 BOMs first: the UTF-16 LE BOM is their prefix
+            for bom, bom_encoding in (
+                (codecs.BOM_UTF32_LE, "utf-32"),
+                (codecs.BOM_UTF32_BE, "utf-32"),
+                (codecs.BOM_UTF16_LE, "utf-16"),
+                (codecs.BOM_UTF16_BE, "utf-16"),
+            ):
+                if head.startswith(bom):
+                    return bom_encoding
+            if head.isascii():
+                return "utf-8"
+            if UniversalDetector is None:
+                # charset_normalizer has no incremental API; detect on a
+                # bounded prefix instead.
+                rawdata = head + f.read(cls._DETECT_MAX_BYTES - len(head))
+                return _detect(rawdata)["encoding"]
+            detector = UniversalDetector()
+            detector.feed(head)
+            bytes_fed = len(head)
+            while not detector.done and bytes_fed < cls._DETECT_MAX_BYTES:
+                chunk = f.read(cls._DETECT_CHUNK_SIZE)
+                if not chunk:
+                    break
+                detector.feed(chunk)
+                bytes_fed += len(chunk)
+        detector.close()
+        return detector.result["encoding"]
 
     @classmethod
     def from_file(cls, file_path: str, column_names: Optional[List[str]] = None) -> "CSVParser":
@@ -64,10 +191,17 @@ class CSVParser:
             encoding = "utf-8"
             logging.warning(f"Warning: Encoding detection failed, using utf-8: {e}")
 
-        file_text = ""
+        csv_parser = cls()
+        csv_parser.file_path = file_path
+        csv_parser._encoding = encoding
         try:
-            with open(file_path, encoding=encoding) as file:
-                file_text = file.read()
+            with open(
+                file_path,
+                encoding=encoding,
+                newline="",
+                buffering=cls._READ_BUFFER_SIZE,
+            ) as file:
+                csv_parser._load_from_reader(csv.reader(file), column_names)
         except UnicodeDecodeError as e:
             raise UnicodeDecodeError(
                 e.encoding,
@@ -76,10 +210,6 @@ class CSVParser:
                 e.end,
                 f"Failed to decode {file_path} with encoding {encoding}: {e.reason}",
             ) from e
-
-        csv_parser = CSVParser.from_csv_text(file_text, column_names)
-        csv_parser.file_path = file_path
-        csv_parser._encoding = encoding
         return csv_parser
 
     @classmethod
@@ -93,9 +223,16 @@ class CSVParser:
         Returns:
             CSVParser: A CSVParser object with the parsed file content.
         """
-        file_text = "\n".join(csv_lines)
-        csv_parser = CSVParser.from_csv_text(file_text, column_names)
+        csv_parser = cls()
         csv_parser.file_path = "init from lines"
+        csv_parser.file_text = "\n".join(csv_lines)
+        # Feed the lines straight to csv.reader instead of re-splitting
+        # the joined text; terminators are restored so quoted fields that
+        # span lines still parse as one record.
+        reader = csv.reader(
+            line if line.endswith("\n") else line + "\n" for line in csv_lines
+        )
+        csv_parser._load_from_reader(reader, column_names)
         return csv_parser
 
     @classmethod
@@ -109,51 +246,93 @@ class CSVParser:
         Returns:
             CSVParser: A CSVParser object with the parsed file content.
         """
-        if column_names is not None and column_names:
-            if not all(isinstance(col, str) for col in column_names):
-                raise TypeError("All column names must be strings")
         csv_parser = cls()
         csv_parser.file_path = "init from text"
         csv_parser.file_text = file_text
-        csv_parser.column_names = (
-            csv_parser._get_column_names_from_header_row(file_text)
-            if not column_names
-            else column_names
-        )
         with io.StringIO(file_text) as file:
-            dict_reader = csv.DictReader(file, column_names)
-            csv_parser.list_of_dicts = list(dict_reader)
+            csv_parser._load_from_reader(csv.reader(file), column_names)
         return csv_parser
 
-    def _get_column_names_from_header_row(self, file_text: str) -> List[str]:
-        """Extract column names from the first row of CSV text.
+    def _load_from_reader(
+        self, reader: Iterator[List[str]], column_names: Optional[List[str]]
+    ) -> None:
+        """Populate column names and rows from a csv reader in one pass.
 
         Args:
-            file_text (str): CSV content as text.
+            reader: A csv.reader over the CSV source.
+            column_names: Optional list of column names. If None or empty,
+                the header row is consumed from the reader instead.
 
-        Returns:
-            List[str]: List of column names, with duplicates made unique.
+        Raises:
+            TypeError: If column_names contains non-string elements.
         """
-        with io.StringIO(file_text) as file:
-            reader = csv.reader(file)
-            try:
-                header_row = next(reader)
-            except StopIteration:
-                return []
-        return self._unique_vals(header_row)
+        if column_names:
+            if not all(isinstance(col, str) for col in column_names):
+                raise TypeError("All column names must be strings")
+            names = column_names
+            self._header_in_file = False
+        else:
+            # No explicit names: consume the header row from the same
+            # reader so the source is only tokenized once.
+            names = list(self._unique_header(tuple(next(reader, []))))
+        # Interned keys make the per-row dict lookups a pointer compare
+        # instead of a full string hash and compare
+        names = [sys.intern(name) for name in names]
+        self.column_names = names
+        keys = tuple(names)
+        self.list_of_dicts = [dict(zip(keys, row)) for row in reader if row]
+
+    def _invalidate_caches(self) -> None:
+        """Drop cached derived views after a mutation and bump the version."""
+        self._row_by_index = {}
+        self._groups = {}
+        self._columns_cache = None
+        self._version += 1
+
+    def _ensure_row_index(self) -> None:
+        """Build the index-value lookup table lazily if it was invalidated.
+
+        Keeps the first row for duplicate index values, matching the
+        first-match semantics of the linear scan it replaces.
+        """
+        if self._row_by_index or not self.list_of_dicts:
+            return
+        index_column = self._index_column or self.column_names[0]
+        row_by_index: Dict[str, Dict[str, str]] = {}
+        for row in self.list_of_dicts:
+            row_by_index.setdefault(row.get(index_column), row)
+        self._row_by_index = row_by_index
 
     def strip_whitespace(self) -> None:
         """Strip leading and trailing whitespace from all keys and values."""
-        self.list_of_dicts = [
-            {
-                (key.strip() if isinstance(key, str) else key): (
-                    value.strip() if isinstance(value, str) else value
-                )
-                for key, value in item.items()
-            }
-            for item in self.list_of_dicts
+        self._invalidate_caches()
+        keys_need_strip = any(
+            col != col.strip() for col in self.column_names if isinstance(col, str)
+        )
+        for row in self.list_of_dicts:
+            if keys_need_strip:
+                # Rare path: keys change, so rebuild the row's entries.
+                # Interning the stripped keys restores the single shared
+                # key object per column across all rows.
+                for key in list(row):
+                    value = row.pop(key)
+                    row[sys.intern(key.strip()) if isinstance(key, str) else key] = (
+                        value.strip() if isinstance(value, str) else value
+                    )
+            else:
+                # Common path: mutate values in place, reusing the row
+                # dicts. csv.reader only produces strings, so the whole
+                # row strips in one C-level map/update pass; the per-item
+                # loop is kept as a fallback for non-string values.
+                try:
+                    row.update(zip(row.keys(), map(str.strip, row.values())))
+                except TypeError:
+                    for key, value in row.items():
+                        if isinstance(value, str):
+                            row[key] = value.strip()
+        self.column_names = [
+            sys.intern(x.strip()) for x in self.column_names if isinstance(x, str)
         ]
-        self.column_names = [x.strip() for x in self.column_names if isinstance(x, str)]
         if isinstance(self._index_column, str):
             self._index_column = self._index_column.strip()
 
@@ -164,11 +343,16 @@ class CSVParser:
             column_name (str): Column name on which the transform is to be applied.
             func (Callable): Transformer function to execute on each row.
         """
-        self.list_of_dicts = [
-            {**item, column_name: func(item)} for item in self.list_of_dicts
-        ]
-        if column_name not in self.column_names:
-            self.column_names.append(column_name)
+        self._invalidate_caches()
+        # map drives the transform calls from C; staging the results
+        # first also means a transform that raises leaves no row
+        # partially updated
+        new_values = list(map(func, self.list_of_dicts))
+        for row, new_value in zip(self.list_of_dicts, new_values):
+            row[column_name] = new_value
+        if column_name not in self._column_set:
+            self._column_names.append(column_name)
+            self._column_set.add(column_name)
 
     def rename_column(self, old_column_name: str, new_column_name: str) -> None:
         """Rename a column to a new name.
@@ -180,9 +364,13 @@ class CSVParser:
         Raises:
             ValueError: If the old_column_name does not exist in the CSV.
         """
-        if old_column_name not in self.column_names:
+        if old_column_name not in self._column_set:
             raise ValueError(f"Column '{old_column_name}' not found in column names")
 
+        self._invalidate_caches()
+        # Intern so the renamed key stays a single shared object, like
+        # the keys produced at parse time
+        new_column_name = sys.intern(new_column_name)
         for row in self.list_of_dicts:
             if old_column_name in row:
                 row[new_column_name] = row.pop(old_column_name)
@@ -205,6 +393,11 @@ class CSVParser:
             Dict[str, str]: Dictionary representation of the first matching row
                 or an empty dictionary if a match is not found.
         """
+        if self.column_names and column_name == (
+            self._index_column or self.column_names[0]
+        ):
+            self._ensure_row_index()
+            return self._row_by_index.get(row_value, {})
         row: Dict[str, str] = {}
         rows = self.get_rows(column_name, row_value)
         if rows:
@@ -222,30 +415,103 @@ class CSVParser:
             List[Dict[str, str]]: List of dictionaries of the matching rows
                 or an empty list if a match is not found.
         """
-        rows: List[Dict[str, str]] = []
-        if column_name in self.column_names:
-            matching_row = lambda row: row.get(column_name) == row_value
-            rows = list(filter(matching_row, self.list_of_dicts))
-        return rows
+        if column_name not in self._column_set:
+            return []
+        return list(self._ensure_groups(column_name).get(row_value, ()))
+
+    def _ensure_groups(self, column_name: str) -> Dict[str, List[Dict[str, str]]]:
+        """Group rows by their value in a column, lazily and cached.
+
+        One O(N) pass builds a value -> rows table per queried column,
+        so repeated get_rows calls are O(matches) instead of a full
+        scan each. Cleared by _invalidate_caches on mutation.
+
+        Args:
+            column_name (str): Column name to group by.
+
+        Returns:
+            Dict[str, List[Dict[str, str]]]: Rows keyed by column value.
+        """
+        groups = self._groups.get(column_name)
+        if groups is None:
+            groups = {}
+            for row in self.list_of_dicts:
+                groups.setdefault(row.get(column_name), []).append(row)
+            self._groups[column_name] = groups
+        return groups
+
+    def iter_rows(self) -> Iterator[Dict[str, str]]:
+        """Iterate over rows one dictionary at a time.
+
+        For unmutated file-backed parsers the rows are streamed straight
+        from disk, so memory stays constant regardless of file size;
+        callers that only need a single pass can avoid the parsed list
+        entirely. Parsers built from text or lines, or mutated since
+        loading, yield from the in-memory rows instead so the stream
+        always reflects the current data.
+
+        Yields:
+            Dict[str, str]: One dictionary per row, keyed by column name.
+
+        Raises:
+            UnicodeDecodeError: If a file-backed parser's file cannot be
+                decoded with the detected encoding.
+        """
+        if self._version or not os.path.isfile(self.file_path):
+            yield from self.list_of_dicts
+            return
+        with open(
+            self.file_path,
+            encoding=self._encoding,
+            newline="",
+            buffering=self._READ_BUFFER_SIZE,
+        ) as file:
+            reader = csv.reader(file)
+            if self._header_in_file:
+                # Explicit column names at load time mean the first file
+                # row is data, not a header
+                next(reader, None)
+            keys = tuple(self.column_names)
+            for row in reader:
+                if row:
+                    yield dict(zip(keys, row))
 
     @property
     def has_error(self) -> bool:
         """Check if there are any errors in the CSV file.
 
+        The result is derived purely from file_text, so it is computed
+        once and cached until file_text is reassigned.
+
         Returns:
             bool: True if there are any errors (e.g., inconsistent column counts),
                 otherwise False.
         """
+        if self._has_error_cache is not None:
+            return self._has_error_cache
+        self._has_error_cache = self._check_has_error()
+        return self._has_error_cache
+
+    def _check_has_error(self) -> bool:
+        """Scan file_text for inconsistent column counts."""
+        if '"' not in self.file_text:
+            # No quoted fields, so a delimiter count per line is enough.
+            # str.count scans in C, far faster than a full csv parse.
+            lines = self.file_text.splitlines()
+            if not lines:
+                return False
+            expected_cols = lines[0].count(",") + 1
+            return any(
+                (line.count(",") + 1 if line else 0) != expected_cols
+                for line in lines[1:]
+            )
         reader = csv.reader(io.StringIO(self.file_text))
         try:
             header = next(reader)
         except StopIteration:
             return False
         expected_cols = len(header)
-        for _, row in enumerate(reader, start=2):
-            if len(row) != expected_cols:
-                return True
-        return False
+        return any(len(row) != expected_cols for row in reader)
 
     def drop_columns(self, column_names: List[str]) -> None:
         """Drop (remove) the columns.
@@ -253,18 +519,13 @@ class CSVParser:
         Args:
             column_names (List[str]): List of column names to drop (remove).
         """
-        list_of_dicts = []
+        to_drop = set(column_names)
+        self._invalidate_caches()
         for dict_row in self.list_of_dicts:
-            list_of_dicts.append(
-                {
-                    key: value
-                    for key, value in dict_row.items()
-                    if key not in column_names
-                }
-            )
-        self.list_of_dicts = list_of_dicts
+            for col_name in to_drop:
+                dict_row.pop(col_name, None)
         self.column_names = [
-            col_name for col_name in self.column_names if col_name not in column_names
+            col_name for col_name in self.column_names if col_name not in to_drop
         ]
 
     def drop_rows_by(self, predicate: Callable) -> None:
@@ -274,9 +535,10 @@ class CSVParser:
             predicate (Callable): Predicate function applied on each row to determine
                 if it will be dropped.
         """
-        self.list_of_dicts = [
-            dict_row for dict_row in self.list_of_dicts if not predicate(dict_row)
-        ]
+        self._invalidate_caches()
+        # filterfalse drives the predicate loop from C, like filter in
+        # get_rows, instead of an interpreted comprehension
+        self.list_of_dicts = list(filterfalse(predicate, self.list_of_dicts))
 
     def drop_rows(self, column_name: str, row_values: List[str]) -> None:
         """Drop (remove) the rows with matching values in a specified column.
@@ -285,9 +547,10 @@ class CSVParser:
             column_name (str): Column name to search.
             row_values (List[str]): Values to match in the specified column.
         """
-        if column_name not in self.column_names:
+        if column_name not in self._column_set:
             return
-        row_val_check = lambda x: x[column_name] in row_values
+        values_to_drop = frozenset(row_values)
+        row_val_check = lambda x: x[column_name] in values_to_drop
         self.drop_rows_by(row_val_check)
 
     def row_values_in_column(self, column_name: str) -> List[str]:
@@ -300,11 +563,51 @@ class CSVParser:
             List[str]: List of all the row values in that column.
         """
         row_values: List[str] = []
-        if column_name in self.column_names:
+        if column_name in self._column_set:
             row_values = [x.get(column_name, "") for x in self.list_of_dicts]
         return row_values
 
-    def _unique_vals(self, values: List[str]) -> List[str]:
+    def columns(self) -> Dict[str, List[str]]:
+        """Get a columnar snapshot of the data.
+
+        Builds every column in a single pass over the rows, which is
+        cheaper than calling row_values_in_column once per column when
+        several columns are needed. The view is cached until the next
+        mutation, so repeated calls are O(1); treat the result as
+        read-only.
+
+        Returns:
+            Dict[str, List[str]]: Mapping of column name to the list of
+                row values in that column.
+        """
+        if self._columns_cache is not None:
+            return self._columns_cache
+        columns: Dict[str, List[str]] = {name: [] for name in self.column_names}
+        for row in self.list_of_dicts:
+            for name, values in columns.items():
+                values.append(row.get(name, ""))
+        self._columns_cache = columns
+        return columns
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _unique_header(header: Tuple[str, ...]) -> Tuple[str, ...]:
+        """Deduplicate a header row, memoized across parsers.
+
+        Files sharing the same schema (the common case when comparing)
+        hit the cache instead of re-running the suffixing pass. Tuples
+        in and out keep the cached values immutable.
+
+        Args:
+            header (Tuple[str, ...]): Header values, possibly duplicated.
+
+        Returns:
+            Tuple[str, ...]: Header with duplicates renamed.
+        """
+        return tuple(CSVParser._unique_vals(list(header)))
+
+    @staticmethod
+    def _unique_vals(values: List[str]) -> List[str]:
         """Make duplicate values unique by appending numeric suffixes.
 
         Args:
@@ -313,20 +616,23 @@ class CSVParser:
         Returns:
             List[str]: List with duplicates renamed (e.g., col, col.1, col.2).
         """
-        result = list(values)
-        unique_values = set()
-        suffix_counts = defaultdict(int)
-        for idx, val in enumerate(result):
-            if val not in unique_values:
-                unique_values.add(val)
-            else:
-                while True:
-                    suffix_counts[val] += 1
-                    new_val = f"{val}.{suffix_counts[val]}"
-                    if new_val not in unique_values:
-                        unique_values.add(new_val)
-                        result[idx] = new_val
-                        break
+        # seen maps each emitted value to the next suffix to try for it;
+        # the counter never resets, so repeated duplicates stay O(1)
+        # instead of re-counting from 1 on every collision.
+        seen: Dict[str, int] = {}
+        result: List[str] = []
+        for val in values:
+            if val not in seen:
+                seen[val] = 0
+                result.append(val)
+                continue
+            while True:
+                seen[val] += 1
+                new_val = f"{val}.{seen[val]}"
+                if new_val not in seen:
+                    seen[new_val] = 0
+                    result.append(new_val)
+                    break
         return result
 
     @property
@@ -350,12 +656,22 @@ class CSVParser:
         """
         if not self.column_names:
             raise ValueError("No columns available to set the index column")
-        if value not in self.column_names:
+        if value not in self._column_set:
             raise ValueError(f"Column '{value}' not found in column names")
         self._index_column = value
-        row_vals = self._unique_vals(self.row_values_in_column(self._index_column))
+        # Uniquifying duplicate index values below rewrites row data, so
+        # every derived view has to go, not just the columnar cache; the
+        # fresh row lookup table is assigned after the wipe.
+        self._invalidate_caches()
+        row_vals = [
+            sys.intern(val)
+            for val in self._unique_vals(self.row_values_in_column(self._index_column))
+        ]
+        row_by_index: Dict[str, Dict[str, str]] = {}
         for idx, row in enumerate(self.list_of_dicts):
             row[self.index_column] = row_vals[idx]
+            row_by_index[row_vals[idx]] = row
+        self._row_by_index = row_by_index
 
     def get_value(self, row_value_in_index_column: str, column_name: str) -> str:
         """Get value of the cell in the specified row and column.
@@ -381,6 +697,7 @@ class CSVParser:
         row = self.get_row(self.index_column, row_value_in_index_column)
         if row and column_name in row:
             row[column_name] = new_value
+            self._invalidate_caches()
 
     def write_to_file(self) -> None:
         """Write the CSV data back to the source file.
@@ -393,14 +710,20 @@ class CSVParser:
                 f"Cannot write: '{self.file_path}' is not a valid file path. "
                 "write_to_file is only supported when initialized via from_file."
             )
-        with open(self.file_path, "w", newline="", encoding=self._encoding) as f:
-            writer = csv.DictWriter(f, fieldnames=self.column_names)
+        with open(
+            self.file_path,
+            "w",
+            newline="",
+            encoding=self._encoding,
+            buffering=self._READ_BUFFER_SIZE,
+        ) as f:
+            # extrasaction="ignore" drops keys outside column_names, so the
+            # rows can be written directly without a normalized copy
+            writer = csv.DictWriter(
+                f, fieldnames=self.column_names, extrasaction="ignore"
+            )
             writer.writeheader()
-            normalized_rows = [
-                {key: value for key, value in row.items() if key in self.column_names}
-                for row in self.list_of_dicts
-            ]
-            writer.writerows(normalized_rows)
+            writer.writerows(self.list_of_dicts)
 
 
 class NullCSVParser(CSVParser):
@@ -410,6 +733,8 @@ class NullCSVParser(CSVParser):
     when no CSV data has been loaded yet.
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         self.list_of_dicts: List[Dict[str, str]] = []
         self.column_names: List[str] = []
@@ -417,6 +742,12 @@ class NullCSVParser(CSVParser):
         self._index_column: str = ""
         self.file_path: str = "null"
         self._encoding: str = "utf-8"
+        self._header_in_file: bool = True
+        self._row_by_index: Dict[str, Dict[str, str]] = {}
+        self._groups: Dict[str, Dict[str, List[Dict[str, str]]]] = {}
+        self._columns_cache: Optional[Dict[str, List[str]]] = None
+        self._has_error_cache: Optional[bool] = None
+        self._version: int = 0
 
     def strip_whitespace(self) -> None:
         pass
@@ -439,6 +770,9 @@ class NullCSVParser(CSVParser):
     def row_values_in_column(self, column_name: str) -> List[str]:
         return []
 
+    def columns(self) -> Dict[str, List[str]]:
+        return {}
+
     def get_value(self, row_value_in_index_column: str, column_name: str) -> str:
         return ""
 
@@ -1,4 +1,5 @@
 from csv_diff_tool import CSVComparer, CSVCompareOutput
+import pickle
 import unittest
 
 
@@ -86,6 +87,15 @@ class CSVCompareOutputTest(unittest.TestCase):
         assert "\trow 4" in output
         assert "Mismatched rows" in output
 
+    def test_pickle_round_trip(self):
+        file_1_lines = ["column 1,column 2", "row 1,row 1:2"]
+        file_2_lines = ["column 1,column 2", "row 1,row 1:2_mismatch"]
+        csv_comparer = CSVComparer.from_lines(file_1_lines, file_2_lines)
+        compare_result = csv_comparer.compare("column 1")
+        restored = pickle.loads(pickle.dumps(compare_result))
+        assert restored.to_dict() == compare_result.to_dict()
+        assert str(restored) == str(compare_result)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,7 @@
 from csv_diff_tool import CSVComparer, CSVParser
 import io
 import os
+import tempfile
 import unittest
 
 
@@ -266,19 +267,14 @@ class CSVCompareTest(unittest.TestCase):
         self.assertIn("not found in first file", str(ctx.exception))
 
     def test_from_files(self):
-        first_file = "first_file.csv"
-        second_file = "second_file.csv"
-        try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            first_file = os.path.join(tmp_dir, "first_file.csv")
+            second_file = os.path.join(tmp_dir, "second_file.csv")
             self._write_file("column 1,column 2\nrow 1,row 1:2", first_file)
             self._write_file("column 1,column 2\nrow 1,row 1:2", second_file)
             csv_comparer = CSVComparer.from_files(first_file, second_file)
             result = csv_comparer.compare("column 1")
             assert result.match_result
-        finally:
-            if os.path.exists(first_file):
-                os.remove(first_file)
-            if os.path.exists(second_file):
-                os.remove(second_file)
 
     def test_from_csv_parsers(self):
         lines_1 = ["column 1,column 2", "row 1,row 1:2"]
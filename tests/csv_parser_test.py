@@ -1,6 +1,7 @@
 from csv_diff_tool import CSVParser
 import io
 import os
+import tempfile
 import unittest
 
 
@@ -116,6 +117,35 @@ class CSVParserTest(unittest.TestCase):
         assert not csv_parser.get_rows("column nonexistent", "row 1")
         assert not csv_parser.get_rows("column 1", "row nonexistent")
 
+    def test_iter_rows(self):
+        lines = [
+            "column 1,column 2,column 3",
+            "row 1,row 1:2,row 1:3",
+            "row 2,row 2:2,row 2:3",
+        ]
+        csv_parser = CSVParser.from_lines(lines)
+        expected = [
+            {"column 1": "row 1", "column 2": "row 1:2", "column 3": "row 1:3"},
+            {"column 1": "row 2", "column 2": "row 2:2", "column 3": "row 2:3"},
+        ]
+        assert list(csv_parser.iter_rows()) == expected
+
+        expected = [
+            {"column 1": "row 1", "column 2": "row 1:2", "column 3": "row 1:3"}
+        ]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = os.path.join(tmp_dir, "file.csv")
+            file_content = "column 1,column 2,column 3\n" "row 1,row 1:2,row 1:3\n"
+            self._write_file(file_content, file_name, "utf-16")
+            csv_parser = CSVParser.from_file(file_name)
+            assert list(csv_parser.iter_rows()) == expected
+
+            file_content = "row 1,row 1:2,row 1:3\n"
+            self._write_file(file_content, file_name, "utf-16")
+            columns = ["column 1", "column 2", "column 3"]
+            csv_parser = CSVParser.from_file(file_name, columns)
+            assert list(csv_parser.iter_rows()) == expected
+
     def test_drop_rows(self):
         lines = [
             "column 1,column 2,column 3",
@@ -159,6 +189,20 @@ class CSVParserTest(unittest.TestCase):
         assert csv_parser.column_names == ["column 1", "column 3"]
         assert csv_parser.get_value("row 1", "column 3") == "row 1:3"
 
+    def test_columns(self):
+        lines = [
+            "column 1,column 2,column 3",
+            "row 1,row 1:2,row 1:3",
+            "row 2,row 2:2,row 2:3",
+        ]
+        csv_parser = CSVParser.from_lines(lines)
+        expected = {
+            "column 1": ["row 1", "row 2"],
+            "column 2": ["row 1:2", "row 2:2"],
+            "column 3": ["row 1:3", "row 2:3"],
+        }
+        assert csv_parser.columns() == expected
+
     def test_invalid_csv(self):
         lines = [
             "column 1,column 2,column 3",
@@ -224,6 +268,22 @@ class CSVParserTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             csv_parser.index_column = "column nonexistent"
 
+    def test_index_with_duplicate_values(self):
+        lines = [
+            "column 1,column 2",
+            "row 1,row 1:2",
+            "row 1,row 2:2",
+        ]
+        csv_parser = CSVParser.from_lines(lines)
+        assert len(csv_parser.get_rows("column 1", "row 1")) == 2
+        csv_parser.index_column = "column 1"
+        assert csv_parser.get_rows("column 1", "row 1") == [
+            {"column 1": "row 1", "column 2": "row 1:2"}
+        ]
+        assert csv_parser.get_rows("column 1", "row 1.1") == [
+            {"column 1": "row 1.1", "column 2": "row 2:2"}
+        ]
+
     def test_get_and_set_value(self):
         lines = [
             "column 1,column 2,column 3",
@@ -280,6 +340,20 @@ class CSVParserTest(unittest.TestCase):
         assert csv_parser.get_value("row 1", "new_column_name") == "row 1:2"
         assert csv_parser.get_value("row 2", "new_column_name") == "row 2:2"
 
+    def test_rename_column_reusing_old_name(self):
+        lines = [
+            "column 1,column 2",
+            "row 1,row 1:2",
+        ]
+        csv_parser = CSVParser.from_lines(lines)
+        csv_parser.get_rows("column 1", "row 1")
+        csv_parser.rename_column("column 1", "column new")
+        csv_parser.rename_column("column 2", "column 1")
+        assert csv_parser.get_rows("column 1", "row 1:2") == [
+            {"column new": "row 1", "column 1": "row 1:2"}
+        ]
+        assert not csv_parser.get_rows("column 1", "row 1")
+
     def test_rename_column_nonexistent(self):
         lines = [
             "column 1,column 2,column 3",